@@ -1,84 +1,115 @@
 #!/usr/bin/env python3
 """WCAG 2.1 Contrast Ratio Calculator for Hawala Theme"""
 
+import sys
+from functools import lru_cache
+
+# sRGB -> linear transfer for every 8-bit channel value
+_LIN = tuple(
+    (c / 255) / 12.92 if c / 255 <= 0.03928 else ((c / 255 + 0.055) / 1.055) ** 2.4
+    for c in range(256)
+)
+
 def hex_to_rgb(hex_color):
     hex_color = hex_color.lstrip('#')
     return tuple(int(hex_color[i:i+2], 16) for i in (0, 2, 4))
 
 def luminance(r, g, b):
-    def channel(c):
-        c = c / 255
-        return c / 12.92 if c <= 0.03928 else ((c + 0.055) / 1.055) ** 2.4
-    return 0.2126 * channel(r) + 0.7152 * channel(g) + 0.0722 * channel(b)
+    # Grayscale: the channel weights sum to 1
+    if r == g == b:
+        return _LIN[r]
+    return 0.2126 * _LIN[r] + 0.7152 * _LIN[g] + 0.0722 * _LIN[b]
+
+@lru_cache(maxsize=None)
+def _lum_hex(hex_color):
+    return luminance(*hex_to_rgb(hex_color))
 
 def contrast_ratio(color1, color2):
-    rgb1 = hex_to_rgb(color1)
-    rgb2 = hex_to_rgb(color2)
-    lum1 = luminance(*rgb1)
-    lum2 = luminance(*rgb2)
-    lighter = max(lum1, lum2)
-    darker = min(lum1, lum2)
+    lum1 = _lum_hex(color1)
+    lum2 = _lum_hex(color2)
+    lighter, darker = (lum1, lum2) if lum1 >= lum2 else (lum2, lum1)
     return (lighter + 0.05) / (darker + 0.05)
 
-def check(name, fg, bg, min_ratio=4.5):
-    ratio = contrast_ratio(fg, bg)
-    status = "PASS" if ratio >= min_ratio else "FAIL"
-    print(f"{status} {name}: {ratio:.2f}:1 (need {min_ratio}:1)")
-    return ratio >= min_ratio
+def contrast_ratios(pairs):
+    """Contrast ratio for every (fg, bg) pair; _lum_hex decodes each distinct color once."""
+    return [contrast_ratio(fg, bg) for fg, bg in pairs]
+
+def run_checks(rows):
+    """
+    Evaluate every (name, fg, bg, min_ratio) row in one batch and return the
+    report lines. Plain string rows are section headings and pass through.
+    """
+    checks = [row for row in rows if isinstance(row, tuple)]
+    ratios = iter(contrast_ratios([(fg, bg) for _, fg, bg, _ in checks]))
+    out = []
+    for row in rows:
+        if isinstance(row, str):
+            out.append(row)
+            continue
+        name, _, _, min_ratio = row
+        ratio = next(ratios)
+        status = "PASS" if ratio >= min_ratio else "FAIL"
+        out.append(f"{status} {name}: {ratio:.2f}:1 (need {min_ratio}:1)")
+    return out
 
-print("=" * 60)
-print("DARK MODE CONTRAST ANALYSIS")
-print("=" * 60)
 dark_bg = "0D0D0D"
 dark_bg_secondary = "1A1A1A"
 dark_bg_tertiary = "252525"
-
-print("\n--- Text on Primary Background (#0D0D0D) ---")
-check("textPrimary (white)", "FFFFFF", dark_bg)
-check("textSecondary (#A0A0A0)", "A0A0A0", dark_bg)
-check("textTertiary (#8E8E8E) [FIXED]", "8E8E8E", dark_bg)
-
-print("\n--- Text on Tertiary Background (#252525) ---")
-check("textPrimary (white)", "FFFFFF", dark_bg_tertiary)
-check("textSecondary (#A0A0A0)", "A0A0A0", dark_bg_tertiary)
-check("textTertiary (#8E8E8E) [FIXED]", "8E8E8E", dark_bg_tertiary)
-
-print("\n--- Status Colors on Dark Background (UPDATED) ---")
-check("accent (#835EF8)", "835EF8", dark_bg)
-check("success (#32D74B) [FIXED]", "32D74B", dark_bg)
-check("warning (#FFD60A) [FIXED]", "FFD60A", dark_bg)
-check("error (#FF453A) [FIXED]", "FF453A", dark_bg)
-check("info (#64D2FF) [FIXED]", "64D2FF", dark_bg)
-
-print("\n" + "=" * 60)
-print("LIGHT MODE CONTRAST ANALYSIS")
-print("=" * 60)
 light_bg = "F5F5F7"
 light_bg_tertiary = "E8E8ED"
 
-print("\n--- Text on Primary Background (#F5F5F7) ---")
-check("textPrimary (#1D1D1F)", "1D1D1F", light_bg)
-check("textSecondary (#6E6E73)", "6E6E73", light_bg)
-check("textTertiary (#6B6B70) [FIXED]", "6B6B70", light_bg)
-
-print("\n--- Status Colors on Light Background (UPDATED) ---")
-check("accent (#835EF8)", "835EF8", light_bg, 3.0)  # Large text acceptable
-check("success (#1E7E34) [FIXED]", "1E7E34", light_bg)
-check("warning (#856404) [FIXED]", "856404", light_bg)
-check("error (#C82333) [FIXED]", "C82333", light_bg)
-check("info (#117A8B) [FIXED]", "117A8B", light_bg)
-
-print("\n" + "=" * 60)
-print("CHAIN COLORS (Large Text/Icons - 3:1 minimum)")
-print("=" * 60)
-print("\n--- On Dark Background (#0D0D0D) ---")
-check("Bitcoin (#F7931A)", "F7931A", dark_bg, 3.0)
-check("Ethereum (#627EEA)", "627EEA", dark_bg, 3.0)
-check("Solana (#9945FF)", "9945FF", dark_bg, 3.0)
-check("XRP (#00AAE4)", "00AAE4", dark_bg, 3.0)
-check("BNB (#F3BA2F)", "F3BA2F", dark_bg, 3.0)
-check("Monero (#FF6600)", "FF6600", dark_bg, 3.0)
-
-print("\n" + "=" * 60)
-print("SUMMARY: Issues to fix")
-print("=" * 60)
+rows = [
+    "=" * 60,
+    "DARK MODE CONTRAST ANALYSIS",
+    "=" * 60,
+
+    "\n--- Text on Primary Background (#0D0D0D) ---",
+    ("textPrimary (white)", "FFFFFF", dark_bg, 4.5),
+    ("textSecondary (#A0A0A0)", "A0A0A0", dark_bg, 4.5),
+    ("textTertiary (#8E8E8E) [FIXED]", "8E8E8E", dark_bg, 4.5),
+
+    "\n--- Text on Tertiary Background (#252525) ---",
+    ("textPrimary (white)", "FFFFFF", dark_bg_tertiary, 4.5),
+    ("textSecondary (#A0A0A0)", "A0A0A0", dark_bg_tertiary, 4.5),
+    ("textTertiary (#8E8E8E) [FIXED]", "8E8E8E", dark_bg_tertiary, 4.5),
+
+    "\n--- Status Colors on Dark Background (UPDATED) ---",
+    ("accent (#835EF8)", "835EF8", dark_bg, 4.5),
+    ("success (#32D74B) [FIXED]", "32D74B", dark_bg, 4.5),
+    ("warning (#FFD60A) [FIXED]", "FFD60A", dark_bg, 4.5),
+    ("error (#FF453A) [FIXED]", "FF453A", dark_bg, 4.5),
+    ("info (#64D2FF) [FIXED]", "64D2FF", dark_bg, 4.5),
+
+    "\n" + "=" * 60,
+    "LIGHT MODE CONTRAST ANALYSIS",
+    "=" * 60,
+
+    "\n--- Text on Primary Background (#F5F5F7) ---",
+    ("textPrimary (#1D1D1F)", "1D1D1F", light_bg, 4.5),
+    ("textSecondary (#6E6E73)", "6E6E73", light_bg, 4.5),
+    ("textTertiary (#6B6B70) [FIXED]", "6B6B70", light_bg, 4.5),
+
+    "\n--- Status Colors on Light Background (UPDATED) ---",
+    ("accent (#835EF8)", "835EF8", light_bg, 3.0),  # Large text acceptable
+    ("success (#1E7E34) [FIXED]", "1E7E34", light_bg, 4.5),
+    ("warning (#856404) [FIXED]", "856404", light_bg, 4.5),
+    ("error (#C82333) [FIXED]", "C82333", light_bg, 4.5),
+    ("info (#117A8B) [FIXED]", "117A8B", light_bg, 4.5),
+
+    "\n" + "=" * 60,
+    "CHAIN COLORS (Large Text/Icons - 3:1 minimum)",
+    "=" * 60,
+    "\n--- On Dark Background (#0D0D0D) ---",
+    ("Bitcoin (#F7931A)", "F7931A", dark_bg, 3.0),
+    ("Ethereum (#627EEA)", "627EEA", dark_bg, 3.0),
+    ("Solana (#9945FF)", "9945FF", dark_bg, 3.0),
+    ("XRP (#00AAE4)", "00AAE4", dark_bg, 3.0),
+    ("BNB (#F3BA2F)", "F3BA2F", dark_bg, 3.0),
+    ("Monero (#FF6600)", "FF6600", dark_bg, 3.0),
+
+    "\n" + "=" * 60,
+    "SUMMARY: Issues to fix",
+    "=" * 60,
+]
+
+sys.stdout.write('\n'.join(run_checks(rows)) + '\n')
@@ -0,0 +1,21 @@
+#!/usr/bin/env python3
+"""
+Rewrite a source file in place without ever leaving it half-written.
+Shared by wrap_debug_prints.py and swift-app/fix_previews.py.
+"""
+import os
+import shutil
+
+
+def replace_file(path, text):
+    """Write text to a sibling temp file, give it path's mode, then swap it in."""
+    tmp_path = path + '.tmp'
+    try:
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(text)
+        shutil.copymode(path, tmp_path)
+        os.replace(tmp_path, path)
+    finally:
+        # Still present only if the write or the swap failed
+        if os.path.exists(tmp_path):
+            os.unlink(tmp_path)
@@ -6,59 +6,63 @@ import re
 
 contentview_path = "/Users/x/Desktop/888/swift-app/Sources/swift-app/ContentView.swift"
 
-with open(contentview_path, 'r') as f:
-    content = f.read()
-
-# 1. Add BalanceService StateObject after walletVM
-content = content.replace(
-    '@StateObject private var walletVM = WalletViewModel()',
-    '@StateObject private var walletVM = WalletViewModel()\n    @StateObject private var balanceService = BalanceService.shared'
+# Duplicate @State declarations for balance-related properties, removed in one pass
+state_declarations_pattern = re.compile(
+    r'@State private var (?:'
+    r'balanceStates: \[String: ChainBalanceState\]'
+    r'|cachedBalances: \[String: CachedBalance\]'
+    r'|balanceBackoff: \[String: BackoffTracker\]'
+    r'|balanceFetchTasks: \[String: Task<Void, Never>\]'
+    r') = \[:\]\n\s*'
 )
 
-# 2. Remove duplicate @State declarations for balance-related properties
-state_declarations_to_remove = [
-    r'@State private var balanceStates: \[String: ChainBalanceState\] = \[:\]\n\s*',
-    r'@State private var cachedBalances: \[String: CachedBalance\] = \[:\]\n\s*',
-    r'@State private var balanceBackoff: \[String: BackoffTracker\] = \[:\]\n\s*',
-    r'@State private var balanceFetchTasks: \[String: Task<Void, Never>\] = \[:\]\n\s*',
-]
-
-for pattern in state_declarations_to_remove:
-    content = re.sub(pattern, '', content)
+# Direct state accesses to route through balanceService
+# Subscript and member accesses for all four properties share one pass
+balance_state_props = ['balanceStates', 'cachedBalances', 'balanceBackoff', 'balanceFetchTasks']
+state_access_pattern = re.compile(
+    r'(?<!balanceService\.)(' + '|'.join(map(re.escape, balance_state_props)) + r')(?=[\[.])'
+)
 
-# 3. Replace direct state accesses with balanceService
-replacements = [
-    # Balance states
-    (r'(?<!balanceService\.)balanceStates\[', 'balanceService.balanceStates['),
-    (r'(?<!balanceService\.)balanceStates\.', 'balanceService.balanceStates.'),
-    (r'\$balanceStates', '$balanceService.balanceStates'),
-    
-    # Cached balances
-    (r'(?<!balanceService\.)cachedBalances\[', 'balanceService.cachedBalances['),
-    (r'(?<!balanceService\.)cachedBalances\.', 'balanceService.cachedBalances.'),
-    
-    # Balance backoff
-    (r'(?<!balanceService\.)balanceBackoff\[', 'balanceService.balanceBackoff['),
-    (r'(?<!balanceService\.)balanceBackoff\.', 'balanceService.balanceBackoff.'),
-    
-    # Balance fetch tasks
-    (r'(?<!balanceService\.)balanceFetchTasks\[', 'balanceService.balanceFetchTasks['),
-    (r'(?<!balanceService\.)balanceFetchTasks\.', 'balanceService.balanceFetchTasks.'),
+# Remaining bindings and method calls are plain literals, so they skip the regex engine
+literal_replacements = [
+    # Balance state bindings
+    ('$balanceStates', '$balanceService.balanceStates'),
     
     # Method calls
-    (r'startBalanceFetch\(for:', 'balanceService.startBalanceFetch(for:'),
-    (r'startEthereumAndTokenBalanceFetch\(', 'balanceService.startEthereumAndTokenBalanceFetch('),
-    (r'cancelBalanceFetchTasks\(\)', 'balanceService.cancelBalanceFetchTasks()'),
-    (r'refreshAllBalances\(\)', 'balanceService.refreshAllBalances(keys: keys!)'),
-    (r'extractNumericAmount\(from:', 'balanceService.extractNumericAmount(from:'),
-    (r'formatCryptoAmount\(', 'balanceService.formatCryptoAmount('),
+    ('startBalanceFetch(for:', 'balanceService.startBalanceFetch(for:'),
+    ('startEthereumAndTokenBalanceFetch(', 'balanceService.startEthereumAndTokenBalanceFetch('),
+    ('cancelBalanceFetchTasks()', 'balanceService.cancelBalanceFetchTasks()'),
+    ('refreshAllBalances()', 'balanceService.refreshAllBalances(keys: keys!)'),
+    ('extractNumericAmount(from:', 'balanceService.extractNumericAmount(from:'),
+    ('formatCryptoAmount(', 'balanceService.formatCryptoAmount('),
 ]
 
-for pattern, replacement in replacements:
-    content = re.sub(pattern, replacement, content)
+def transform(content):
+    """Wire BalanceService into ContentView and point balance state/calls at it"""
+    # Add BalanceService StateObject after walletVM
+    content = content.replace(
+        '@StateObject private var walletVM = WalletViewModel()',
+        '@StateObject private var walletVM = WalletViewModel()\n    @StateObject private var balanceService = BalanceService.shared'
+    )
+
+    # Remove duplicate @State declarations for balance-related properties
+    content = state_declarations_pattern.sub('', content)
+
+    # Replace direct state accesses with balanceService
+    content = state_access_pattern.sub(r'balanceService.\1', content)
+    for old, new in literal_replacements:
+        content = content.replace(old, new)
+
+    return content
+
+if __name__ == '__main__':
+    with open(contentview_path, 'r') as f:
+        content = f.read()
+
+    content = transform(content)
 
-with open(contentview_path, 'w') as f:
-    f.write(content)
+    with open(contentview_path, 'w') as f:
+        f.write(content)
 
-print("Updated ContentView to use BalanceService")
-print("Next step: Remove the balance-related method implementations from ContentView")
+    print("Updated ContentView to use BalanceService")
+    print("Next step: Remove the balance-related method implementations from ContentView")
@@ -3,13 +3,10 @@
 Phase 6b: Remove duplicate balance methods from ContentView
 These methods are now in BalanceService
 """
-import re
+from swift_methods import remove_methods
 
 contentview_path = "/Users/x/Desktop/888/swift-app/Sources/swift-app/ContentView.swift"
 
-with open(contentview_path, 'r') as f:
-    lines = f.readlines()
-
 # Methods to remove (they're now in BalanceService)
 methods_to_remove = [
     'fetchBitcoinBalance',
@@ -48,51 +45,20 @@ methods_to_remove = [
     'formatRetryDuration',
 ]
 
-content = ''.join(lines)
+def transform(content):
+    """Remove the balance methods that BalanceService now owns"""
+    content, removed = remove_methods(content, methods_to_remove)
+    for method, (start_idx, end_idx) in removed.items():
+        print(f"Removing {method}: {end_idx - start_idx} chars")
 
-def remove_method(content, method_name):
-    """Remove a method definition by finding matching braces"""
-    # Pattern to find function start
-    patterns = [
-        rf'\n    @MainActor\n    private func {method_name}\(',
-        rf'\n    private func {method_name}\('
-    ]
-    
-    for start_pat in patterns:
-        match = re.search(start_pat, content)
-        if match:
-            start_idx = match.start()
-            # Find matching closing brace
-            brace_count = 0
-            in_method = False
-            end_idx = start_idx
-            
-            for i, char in enumerate(content[start_idx:], start_idx):
-                if char == '{':
-                    brace_count += 1
-                    in_method = True
-                elif char == '}':
-                    brace_count -= 1
-                    if in_method and brace_count == 0:
-                        end_idx = i + 1
-                        break
-            
-            if end_idx > start_idx:
-                removed_len = end_idx - start_idx
-                print(f"Removing {method_name}: {removed_len} chars")
-                content = content[:start_idx] + content[end_idx:]
-                return content
-    
+    print(f"\nRemoved {len(removed)} methods from ContentView")
     return content
 
-removed_count = 0
-for method in methods_to_remove:
-    old_len = len(content)
-    content = remove_method(content, method)
-    if len(content) < old_len:
-        removed_count += 1
+if __name__ == '__main__':
+    with open(contentview_path, 'r') as f:
+        content = f.read()
 
-with open(contentview_path, 'w') as f:
-    f.write(content)
+    content = transform(content)
 
-print(f"\nRemoved {removed_count} methods from ContentView")
+    with open(contentview_path, 'w') as f:
+        f.write(content)
@@ -8,11 +8,6 @@ import re
 
 contentview_path = "/Users/x/Desktop/888/swift-app/Sources/swift-app/ContentView.swift"
 
-with open(contentview_path, 'r') as f:
-    content = f.read()
-
-original_len = len(content)
-
 # Balance methods that exist in BalanceService and need their CALLS updated
 # We only replace calls INSIDE function bodies, not the function definitions themselves
 balance_methods = [
@@ -38,37 +33,37 @@ balance_methods = [
 ]
 
 # Replace method calls (but not function definitions)
-# Pattern: "try await methodName(" or just "methodName(" at start of expression
-for method in balance_methods:
-    # Replace "try await methodName(" with "try await balanceService.methodName("
-    pattern = rf'try await (?!balanceService\.){method}\('
-    replacement = f'try await balanceService.{method}('
-    content = re.sub(pattern, replacement, content)
-    
-    # Replace "return methodName(" with "return balanceService.methodName("
-    pattern = rf'return (?!balanceService\.){method}\('
-    replacement = f'return balanceService.{method}('
-    content = re.sub(pattern, replacement, content)
+# Pattern: "try await methodName(" or "return methodName(" - every method and
+# both contexts share one alternation, so the file is scanned once
+method_names = '|'.join(map(re.escape, sorted(balance_methods, key=len, reverse=True)))
+method_call_pattern = re.compile(rf'(try await |return )({method_names})\(')
 
-# Replace startBalanceFetch and startEthereumAndTokenBalanceFetch calls
-content = re.sub(r'(?<!\.)startBalanceFetch\(for:', 'balanceService.startBalanceFetch(for:', content)
-content = re.sub(r'(?<!\.)startEthereumAndTokenBalanceFetch\(', 'balanceService.startEthereumAndTokenBalanceFetch(', content)
+# Standalone call sites that don't follow "try await" / "return"
+# The first group may follow anything but '.', the second must also not
+# follow an identifier character
+standalone_call_pattern = re.compile(
+    r'(?<!\.)(?:startBalanceFetch\(for:|startEthereumAndTokenBalanceFetch\('
+    r'|scheduleBalanceFetch\(for:|cancelBalanceFetchTasks\(\))'
+    r'|(?<![\.a-zA-Z_])(?:applyLoadingState\(for:|extractNumericAmount\(from:)'
+)
 
-# Replace scheduleBalanceFetch calls
-content = re.sub(r'(?<!\.)scheduleBalanceFetch\(for:', 'balanceService.scheduleBalanceFetch(for:', content)
+def transform(content):
+    """Point balance method call sites at balanceService"""
+    content = method_call_pattern.sub(r'\1balanceService.\2(', content)
+    content = standalone_call_pattern.sub(r'balanceService.\g<0>', content)
 
-# Replace cancelBalanceFetchTasks calls
-content = re.sub(r'(?<!\.)cancelBalanceFetchTasks\(\)', 'balanceService.cancelBalanceFetchTasks()', content)
+    return content
 
-# Replace applyLoadingState calls
-content = re.sub(r'(?<![\.a-zA-Z_])applyLoadingState\(for:', 'balanceService.applyLoadingState(for:', content)
+if __name__ == '__main__':
+    with open(contentview_path, 'r') as f:
+        content = f.read()
 
-# Replace extractNumericAmount calls
-content = re.sub(r'(?<![\.a-zA-Z_])extractNumericAmount\(from:', 'balanceService.extractNumericAmount(from:', content)
+    original_len = len(content)
+    content = transform(content)
 
-with open(contentview_path, 'w') as f:
-    f.write(content)
+    with open(contentview_path, 'w') as f:
+        f.write(content)
 
-new_len = len(content)
-print(f"Updated method calls. Content changed by {original_len - new_len} chars")
-print("Next: Run phase7b to remove function definitions")
+    new_len = len(content)
+    print(f"Updated method calls. Content changed by {original_len - new_len} chars")
+    print("Next: Run phase7b to remove function definitions")
@@ -17,21 +17,8 @@ print(f"Original lines: {len(lines)}")
 # So we need to account for this
 
 # Actually, let's do it in one pass using original line numbers
-# and just mark which lines to keep
-
-keep_lines = []
-for i, line in enumerate(lines):
-    line_num = i + 1  # 1-indexed
-    
-    # Skip the first range (Bitcoin Transaction Types through before SendAssetPickerSheet)
-    if 5877 <= line_num <= 5989:
-        continue
-    
-    # Skip the second range (ChainInfo through KeyGeneratorError ending brace)
-    if 11213 <= line_num <= 13333:
-        continue
-    
-    keep_lines.append(line)
+# and just keep the slices around both ranges (0-indexed bounds below)
+keep_lines = lines[:5876] + lines[5989:11212] + lines[13333:]
 
 print(f"New lines: {len(keep_lines)}")
 print(f"Removed: {len(lines) - len(keep_lines)} lines")
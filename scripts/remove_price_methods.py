@@ -1,33 +1,57 @@
 #!/usr/bin/env python3
+import re
 import sys
 
 with open('/Users/x/Desktop/888/swift-app/Sources/swift-app/ContentView.swift', 'r') as f:
     lines = f.readlines()
 
-# Find start: The @MainActor line before startPriceUpdatesIfNeeded
-# Find end: The line before @MainActor for handleScenePhase
+content = ''.join(lines)
+
+# Find start: The line before startPriceUpdatesIfNeeded (its @MainActor)
+# Find end: The line before @MainActor for the last handleScenePhase
+# Both declarations are located in one pass and mapped to 0-indexed lines
+decl_re = re.compile(
+    r'^.*private func (startPriceUpdatesIfNeeded)\(\)'
+    r'|^.*private func (handleScenePhase)\(_ phase: ScenePhase\)',
+    re.MULTILINE,
+)
+decl_lines = {}
+line_no = 0
+pos = 0
+for match in decl_re.finditer(content):
+    line_no += content.count('\n', pos, match.start())
+    pos = match.start()
+    if line_no > 2600:
+        decl_lines.setdefault(match.group(1) or match.group(2), []).append(line_no)
 
 start_line = None
 end_line = None
+problem = None
+
+start_decls = decl_lines.get('startPriceUpdatesIfNeeded')
+end_decls = decl_lines.get('handleScenePhase')
+if not start_decls:
+    problem = "startPriceUpdatesIfNeeded not found past line 2600"
+else:
+    # Start at the @MainActor line (one line before)
+    start_line = start_decls[0] - 1
 
-for i, line in enumerate(lines):
-    if 'private func startPriceUpdatesIfNeeded()' in line and i > 2600:
-        # Start at the @MainActor line (2 lines before)
-        start_line = i - 1  # @MainActor is one line before
-        break
-
-for i in range(len(lines)-1, 2600, -1):
-    if 'private func handleScenePhase(_ phase: ScenePhase)' in lines[i]:
-        # End at the line before the @MainActor for handleScenePhase
-        # Go back to find the @MainActor
-        for j in range(i-1, i-5, -1):
-            if '@MainActor' in lines[j]:
-                end_line = j - 1  # Line before @MainActor
-                break
-        break
+if not end_decls:
+    problem = problem or "handleScenePhase not found past line 2600"
+else:
+    i = end_decls[-1]
+    # @MainActor may be separated from the declaration by a comment or blank line
+    for j in range(i - 1, i - 5, -1):
+        if '@MainActor' in lines[j]:
+            end_line = j - 1  # Line before @MainActor
+            break
+    else:
+        problem = problem or f"no @MainActor within 4 lines above handleScenePhase at line {i + 1}"
 
 if start_line is None or end_line is None:
-    print(f"Could not find block: start={start_line}, end={end_line}")
+    start_text = start_line + 1 if start_line is not None else None
+    end_text = end_line + 1 if end_line is not None else None
+    print(f"Could not find block: start={start_text}, end={end_text} (1-indexed): {problem}")
     sys.exit(1)
 
 print(f"Removing lines {start_line+1} to {end_line+1} (1-indexed)")
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+"""
+Run the ContentView migration phases in order.
+Reads ContentView.swift once, pipes it through each phase's transform()
+and writes the result back once at the end.
+
+A sha256 of the file after each phase is kept in .migration_state.json
+next to this script. If the file still matches the output recorded for
+a phase, that phase and the ones before it are skipped, so re-running
+the migration does not re-apply replacements that are not idempotent.
+
+Usage: run_migration.py [path/to/ContentView.swift]
+"""
+import hashlib
+import json
+import os
+import sys
+
+from phase5_security_methods import transform as phase5
+from phase6_wire_balance_service import transform as phase6
+from phase6b_remove_balance_methods import transform as phase6b
+from phase7a_update_calls import transform as phase7a
+from phase7b_remove_definitions import transform as phase7b
+
+contentview_path = "/Users/x/Desktop/888/swift-app/Sources/swift-app/ContentView.swift"
+
+STATE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.migration_state.json')
+
+# Phases run strictly in sequence: each one rewrites the previous phase's
+# output (e.g. phase7a's lookbehinds rely on phase6's balanceService.
+# prefixes), and transform() returns the whole file, so two phases can't be
+# run side by side and merged. The remaining work is a few regex passes
+# over one string, cheaper than starting worker processes and shipping
+# the file to them.
+PHASES = [
+    ('phase5', phase5),
+    ('phase6', phase6),
+    ('phase6b', phase6b),
+    ('phase7a', phase7a),
+    ('phase7b', phase7b),
+]
+
+def sha256(content):
+    return hashlib.sha256(content.encode('utf-8')).hexdigest()
+
+def load_state():
+    try:
+        with open(STATE_PATH, 'r') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+def save_state(state):
+    with open(STATE_PATH, 'w') as f:
+        json.dump(state, f, indent=2)
+
+def main():
+    path = sys.argv[1] if len(sys.argv) > 1 else contentview_path
+
+    with open(path, 'r') as f:
+        content = f.read()
+
+    state = load_state()
+    file_state = state.setdefault(os.path.abspath(path), {})
+
+    # Phases always run in order, so matching the recorded output of a phase
+    # means it and every earlier phase have already been applied
+    digest = sha256(content)
+    applied = -1
+    for index, (name, _) in enumerate(PHASES):
+        if file_state.get(name) == digest:
+            applied = index
+    if applied == len(PHASES) - 1:
+        print(f"All phases already applied to {path}")
+        return
+
+    original_lines = content.count('\n') + 1
+    for index, (name, transform) in enumerate(PHASES):
+        if index <= applied:
+            print(f"=== {name} === (already applied, skipping)")
+            continue
+        print(f"=== {name} ===")
+        content = transform(content)
+        file_state[name] = sha256(content)
+
+    with open(path, 'w') as f:
+        f.write(content)
+
+    save_state(state)
+
+    new_lines = content.count('\n') + 1
+    print(f"\nContentView.swift: {original_lines} → {new_lines} lines")
+
+if __name__ == '__main__':
+    main()
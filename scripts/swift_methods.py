@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+Locate and remove `private func` member definitions in a Swift source file.
+Shared by the phase scripts that strip duplicated methods out of ContentView.
+"""
+import re
+
+# Tokens the scanner stops at; everything in between is skipped in C.
+# The method header alternative matches
+# "\n    @MainActor\n    private func name(" or "\n    private func name("
+TOKEN = re.compile(r'\n(?:    @MainActor\n)?    private func (\w+)\(|"""|"|[{}]|//|/\*')
+STRING_REST = re.compile(r'(?:[^"\\\n]|\\.)*"?')
+BLOCK_COMMENT_TOKEN = re.compile(r'/\*|\*/')
+
+
+def find_private_methods(content, names=None):
+    """
+    Walk the source once and return {name: (start, end)} for every
+    `private func` member. The range starts at the newline before the
+    declaration (including a preceding @MainActor line) and ends after the
+    closing brace. Braces inside strings and comments are ignored.
+    If names is given, only those methods are recorded and the scan stops
+    as soon as all of them have been found.
+    """
+    wanted = None if names is None else frozenset(names)
+    methods = {}
+    n = len(content)
+    depth = 0
+    current = None  # (name, start, depth the method was declared at)
+    pos = 0
+    while True:
+        token = TOKEN.search(content, pos)
+        if token is None:
+            break
+        text = token.group()
+        pos = token.end()
+        if text == '{':
+            depth += 1
+        elif text == '}':
+            depth -= 1
+            if current is not None and depth == current[2]:
+                name, start, _ = current
+                current = None
+                if wanted is None or name in wanted:
+                    methods.setdefault(name, (start, pos))
+                    if wanted is not None and len(methods) == len(wanted):
+                        break
+        elif text == '"':
+            pos = STRING_REST.match(content, pos).end()
+        elif text == '"""':
+            close = content.find('"""', pos)
+            pos = n if close == -1 else close + 3
+        elif text == '//':
+            close = content.find('\n', pos)
+            pos = n if close == -1 else close
+        elif text == '/*':
+            # Swift block comments nest
+            nesting = 1
+            while nesting:
+                marker = BLOCK_COMMENT_TOKEN.search(content, pos)
+                if marker is None:
+                    pos = n
+                    break
+                nesting += 1 if marker.group() == '/*' else -1
+                pos = marker.end()
+        elif current is None:
+            current = (token.group(1), token.start(), depth)
+    return methods
+
+
+def remove_methods(content, method_names):
+    """
+    Remove the named methods in one sweep.
+    Returns (new_content, {name: (start, end)}) with ranges relative to the
+    input, keyed in the order of method_names.
+    """
+    found = find_private_methods(content, method_names)
+    removed = {name: found[name] for name in method_names if name in found}
+    # Join the kept slices once instead of re-copying the file per removal
+    kept = []
+    prev = 0
+    for start, end in sorted(removed.values()):
+        kept.append(content[prev:start])
+        prev = end
+    kept.append(content[prev:])
+    return ''.join(kept), removed
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+ContentView properties that moved into navigationVM and securityVM,
+plus their regex alternations, built once at import.
+"""
+import re
+
+# Properties to migrate to navigationVM
+NAV_PROPS = (
+    'showSplashScreen', 'selectedChain', 'onboardingStep',
+    'completedOnboardingThisSession', 'shouldAutoGenerateAfterOnboarding',
+    'showAllPrivateKeysSheet', 'showSettingsPanel', 'showContactsSheet',
+    'showStakingSheet', 'showNotificationsSheet', 'showMultisigSheet',
+    'showHardwareWalletSheet', 'showWatchOnlySheet', 'showWalletConnectSheet',
+    'showReceiveSheet', 'showSendPicker', 'showBatchTransactionSheet',
+    'showL2AggregatorSheet', 'showPaymentLinksSheet', 'showTransactionNotesSheet',
+    'showSellCryptoSheet', 'showPriceAlertsSheet', 'showSmartAccountSheet',
+    'showGasAccountSheet', 'showPasskeyAuthSheet', 'showGaslessTxSheet',
+    'sendChainContext', 'pendingSendChain', 'showSeedPhraseSheet',
+    'showTransactionHistorySheet', 'selectedTransactionForDetail',
+    'speedUpTransaction', 'cancelTransaction', 'viewportWidth',
+    'showSecurityNotice', 'showSecuritySettings', 'showUnlockSheet',
+    'showExportPasswordPrompt', 'showImportPasswordPrompt', 'pendingImportData',
+    'showImportPrivateKeySheet', 'showKeyboardShortcutsHelp'
+)
+
+# Properties to migrate to securityVM
+SECURITY_PROPS = (
+    'showPrivacyBlur', 'biometricState', 'lastActivityTimestamp', 'autoLockTask'
+)
+
+ALL_PROPS = NAV_PROPS + SECURITY_PROPS
+
+def _alternation(names):
+    # Longer names go first so a prefix never wins the match
+    return '|'.join(map(re.escape, sorted(names, key=len, reverse=True)))
+
+NAV_ALT = _alternation(NAV_PROPS)
+SECURITY_ALT = _alternation(SECURITY_PROPS)
+ALL_ALT = _alternation(ALL_PROPS)
@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+Rewrite passes for moving ContentView state into navigationVM/securityVM.
+Shared by the wire_viewmodels scripts; the property lists live in
+viewmodel_props.py.
+"""
+import re
+
+from viewmodel_props import ALL_ALT, NAV_ALT, NAV_PROPS, SECURITY_ALT, SECURITY_PROPS
+
+# One alternation per category and pattern kind, so each is a single pass
+# over the file. The "already prefixed" and "parameter label" checks are
+# done in the callbacks, only for the few positions that actually match a
+# property name.
+nav_binding_re = re.compile(r'\$(' + NAV_ALT + r')\b')
+security_binding_re = re.compile(r'\$(' + SECURITY_ALT + r')\b')
+# Value patterns consume the preceding character instead of looking behind;
+# it is emitted again unchanged
+nav_value_re = re.compile(r'(^|[^$a-zA-Z_])(' + NAV_ALT + r')\b')
+security_value_re = re.compile(r'(^|[^$a-zA-Z_])(' + SECURITY_ALT + r')\b')
+
+# Replacement text per property, formatted once rather than per match
+NAV_BIND_REPL = {prop: f'$navigationVM.{prop}' for prop in NAV_PROPS}
+NAV_VAL_REPL = {prop: f'navigationVM.{prop}' for prop in NAV_PROPS}
+SECURITY_BIND_REPL = {prop: f'$securityVM.{prop}' for prop in SECURITY_PROPS}
+SECURITY_VAL_REPL = {prop: f'securityVM.{prop}' for prop in SECURITY_PROPS}
+
+# A whole line holding an @State declaration like
+# "@State private var showSplashScreen = true" for any migrated property.
+# Lines end at \n only; [^\S\n] keeps the match from spilling onto the next line.
+state_line_re = re.compile(
+    r'^.*@State[^\S\n]+(?:private[^\S\n]+)?var[^\S\n]+(?:' + ALL_ALT + r')\b.*\n?',
+    re.MULTILINE,
+)
+
+
+def strip_state_decls(content):
+    """
+    Drop the @State declarations of every migrated property.
+    Returns (new_content, removed_count).
+    """
+    if '@State' not in content:
+        return content, 0
+    # One pass over the file drops every matching line
+    def drop_line(m):
+        print(f"Removing @State declaration: {m.group().strip()}")
+        return ''
+    return state_line_re.subn(drop_line, content)
+
+
+def replace_nav_properties(content):
+    # A plain substring scan is far cheaper than the regex passes, so skip
+    # them when the file no longer mentions any of these properties
+    if not any(prop in content for prop in NAV_PROPS):
+        return content
+
+    # Replace $prop with $navigationVM.prop (binding) - only if not already prefixed
+    def prefix_binding(m):
+        if content.endswith('navigationVM.', 0, m.start()):
+            return m.group(0)
+        return NAV_BIND_REPL[m.group(1)]
+    content = nav_binding_re.sub(prefix_binding, content)
+
+    # Replace bare property access - not preceded by "navigationVM." or "$" or alphanumeric
+    # and not followed by ":" (to avoid parameter labels)
+    def prefix_value(m):
+        if content.startswith(':', m.end()) or content.endswith('navigationVM.', 0, m.start(2)):
+            return m.group(0)
+        return m.group(1) + NAV_VAL_REPL[m.group(2)]
+    content = nav_value_re.sub(prefix_value, content)
+
+    return content
+
+
+def replace_security_properties(content):
+    if not any(prop in content for prop in SECURITY_PROPS):
+        return content
+
+    def prefix_binding(m):
+        if content.endswith('securityVM.', 0, m.start()):
+            return m.group(0)
+        return SECURITY_BIND_REPL[m.group(1)]
+    content = security_binding_re.sub(prefix_binding, content)
+    def prefix_value(m):
+        if content.startswith(':', m.end()) or content.endswith('securityVM.', 0, m.start(2)):
+            return m.group(0)
+        return m.group(1) + SECURITY_VAL_REPL[m.group(2)]
+    content = security_value_re.sub(prefix_value, content)
+
+    return content
+
+
+def apply_replacements(content):
+    """Prefix every usage of a migrated property with its ViewModel"""
+    content = replace_nav_properties(content)
+    content = replace_security_properties(content)
+    return content
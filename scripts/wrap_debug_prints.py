@@ -8,35 +8,86 @@ Skips prints that are already inside #if DEBUG blocks.
 import os
 import re
 import sys
+from concurrent.futures import ProcessPoolExecutor
 
-def is_inside_debug_block(lines, current_idx):
-    """Check if current line is already inside an #if DEBUG block"""
-    depth = 0
-    for i in range(current_idx - 1, -1, -1):
-        line = lines[i].strip()
-        if line == '#endif':
-            depth += 1
-        elif line.startswith('#if DEBUG') or line == '#if DEBUG':
-            if depth == 0:
-                return True
-            depth -= 1
-        elif line.startswith('#if ') and not line.startswith('#if DEBUG'):
-            if depth == 0:
-                return False
-    return False
+from file_replace import replace_file
+
+# Kinds of preprocessor line, numbered after the groups of directive_pattern
+ENDIF, IF_DEBUG, OTHER_IF, ELSE = range(1, 5)
+directive_pattern = re.compile(
+    r'^[^\S\n]*#(?:(endif)\b|(if DEBUG)\b|(if)[^\S\n]|(else(?:if)?)\b)', re.MULTILINE
+)
+
+def debug_mask(content, line_count):
+    """
+    Return a bytearray where mask[i] is 1 if line i of content sits inside
+    an #if DEBUG branch. Only directive lines are visited, found with one
+    regex pass over the file.
+    """
+    mask = bytearray(line_count)
+    open_blocks = []  # one entry per open #if, True while in a DEBUG branch
+    debug_depth = 0
+    line = 0  # first line not yet filled in
+    directive_line = 0
+    pos = 0
+    for match in directive_pattern.finditer(content):
+        directive_line += content.count('\n', pos, match.start())
+        pos = match.start()
+        # Lines up to and including the directive keep the state before it
+        if debug_depth:
+            mask[line:directive_line + 1] = b'\x01' * (directive_line + 1 - line)
+        line = directive_line + 1
+        kind = match.lastindex
+        if kind == IF_DEBUG:
+            open_blocks.append(True)
+            debug_depth += 1
+        elif kind == OTHER_IF:
+            open_blocks.append(False)
+        elif kind == ELSE:
+            # The #else branch of #if DEBUG is release code
+            if open_blocks and open_blocks[-1]:
+                open_blocks[-1] = False
+                debug_depth -= 1
+        elif kind == ENDIF and open_blocks:
+            if open_blocks.pop():
+                debug_depth -= 1
+    if debug_depth:
+        mask[line:] = b'\x01' * (line_count - line)
+    return mask
+
+# Pattern for print statements with tags like [SendView], [ETH TX], etc.
+# MULTILINE lets the same pattern test a whole file in one search before
+# any per-line work
+tagged_print_pattern = re.compile(r'^(\s*)print\(\s*"?\[', re.MULTILINE)
+
+# Parens are counted outside string literals and // comments only
+paren_token_pattern = re.compile(r'"(?:[^"\\\n]|\\.)*"?|//.*|[()]')
+
+def paren_delta(line):
+    """Return the number of '(' minus ')' in one pass over the line"""
+    delta = 0
+    for token in paren_token_pattern.findall(line):
+        if token == '(':
+            delta += 1
+        elif token == ')':
+            delta -= 1
+    return delta
 
 def process_file(filepath):
     """Process a Swift file to wrap tagged prints in #if DEBUG"""
     with open(filepath, 'r', encoding='utf-8') as f:
         content = f.read()
     
+    # Nothing to wrap unless some line looks like a tagged print
+    if not tagged_print_pattern.search(content):
+        return False
+    
     lines = content.split('\n')
     modified = False
     result = []
     i = 0
-    
-    # Pattern for print statements with tags like [SendView], [ETH TX], etc.
-    tagged_print_pattern = re.compile(r'^(\s*)print\(\s*"?\[')
+    # Which lines are already debug-only, worked out once up front
+    in_debug = debug_mask(content, len(lines))
     
     while i < len(lines):
         line = lines[i]
@@ -47,19 +98,20 @@ def process_file(filepath):
             indent = match.group(1)
             
             # Skip if already inside DEBUG block
-            if is_inside_debug_block(result + [line], len(result)):
+            if in_debug[i]:
                 result.append(line)
                 i += 1
                 continue
             
             # Collect multi-line print statements
             print_lines = [line]
-            paren_count = line.count('(') - line.count(')')
+            paren_count = paren_delta(line)
             
             while paren_count > 0 and i + 1 < len(lines):
                 i += 1
-                print_lines.append(lines[i])
-                paren_count += lines[i].count('(') - lines[i].count(')')
+                next_line = lines[i]
+                print_lines.append(next_line)
+                paren_count += paren_delta(next_line)
             
             # Wrap in #if DEBUG
             result.append(f'{indent}#if DEBUG')
@@ -72,8 +124,7 @@ def process_file(filepath):
         i += 1
     
     if modified:
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.write('\n'.join(result))
+        replace_file(filepath, '\n'.join(result))
         return True
     return False
 
@@ -92,16 +143,23 @@ def main():
     
     modified_count = 0
     
+    found = []
     for relative_path in priority_files:
         filepath = os.path.join(swift_app_dir, relative_path)
         if os.path.exists(filepath):
-            if process_file(filepath):
+            found.append((relative_path, filepath))
+        else:
+            print(f"❌ Not found: {filepath}")
+    
+    # Each file is processed independently, so run them in parallel
+    with ProcessPoolExecutor() as executor:
+        results = executor.map(process_file, [filepath for _, filepath in found])
+        for (relative_path, _), modified in zip(found, results):
+            if modified:
                 print(f"✅ Modified: {relative_path}")
                 modified_count += 1
             else:
                 print(f"⏭️  Skipped (no changes): {relative_path}")
-        else:
-            print(f"❌ Not found: {filepath}")
     
     print(f"\n📊 Total files modified: {modified_count}")
 
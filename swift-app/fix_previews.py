@@ -1,43 +1,89 @@
 #!/usr/bin/env python3
+import mmap
 import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+
+# Shared helpers live with the other maintenance scripts
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'scripts'))
+from file_replace import replace_file
+
+# A line whose first non-blank text is #Preview
+preview_line = re.compile(r'^[^\S\n]*#Preview', re.MULTILINE)
 
 def fix_preview(content):
-    lines = content.split('\n')
+    # Splice '#if false' / '#endif' around each preview block, working on
+    # offsets into content rather than a list of lines
     result = []
-    i = 0
-    while i < len(lines):
-        line = lines[i]
-        if line.strip().startswith('#Preview'):
-            result.append('#if false')
-            brace_count = 0
-            started = False
-            while i < len(lines):
-                result.append(lines[i])
-                brace_count += lines[i].count('{') - lines[i].count('}')
-                if '{' in lines[i]:
-                    started = True
-                if started and brace_count == 0:
-                    break
-                i += 1
-            result.append('#endif')
-        else:
-            result.append(line)
-        i += 1
-    return '\n'.join(result)
+    prev = 0
+    for match in preview_line.finditer(content):
+        start = match.start()
+        if start < prev:
+            # Nested inside the block that was just wrapped
+            continue
+        # The block runs to the end of the first line where the braces
+        # seen so far balance out again
+        brace_count = 0
+        started = False
+        pos = start
+        while True:
+            end = content.find('\n', pos)
+            if end == -1:
+                end = len(content)
+            opened = content.count('{', pos, end)
+            brace_count += opened - content.count('}', pos, end)
+            if opened:
+                started = True
+            if (started and brace_count == 0) or end == len(content):
+                break
+            pos = end + 1
+        result.append(content[prev:start])
+        result.append('#if false\n')
+        result.append(content[start:end])
+        result.append('\n#endif')
+        prev = end
+    result.append(content[prev:])
+    return ''.join(result)
+
+def iter_swift(root):
+    # DirEntry carries the file type from the directory listing, so no extra stat per entry
+    for entry in os.scandir(root):
+        if entry.is_dir(follow_symlinks=False):
+            yield from iter_swift(entry.path)
+        elif entry.name.endswith('.swift') and entry.is_file():
+            yield entry.path
+
+def file_contains(path, needle):
+    """Check for needle through a read-only mapping instead of reading the file"""
+    with open(path, 'rb') as file:
+        # mmap rejects empty files
+        if os.fstat(file.fileno()).st_size == 0:
+            return False
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+            return mapped.find(needle) != -1
+
+def fix_file(path):
+    """Wrap the previews in one file; returns True if it was rewritten"""
+    # Most files have no preview; skip them without reading them in
+    if not file_contains(path, b'#Preview'):
+        return False
+    with open(path, 'r', encoding='utf-8') as file:
+        content = file.read()
+    fixed = fix_preview(content)
+    if fixed == content:
+        return False
+    replace_file(path, fixed)
+    return True
 
 def main():
     root_dir = 'Sources/swift-app'
-    for root, dirs, files in os.walk(root_dir):
-        for f in files:
-            if f.endswith('.swift'):
-                path = os.path.join(root, f)
-                with open(path, 'r') as file:
-                    content = file.read()
-                if '#Preview' in content:
-                    fixed = fix_preview(content)
-                    with open(path, 'w') as file:
-                        file.write(fixed)
-                    print('Fixed:', path)
+    paths = list(iter_swift(root_dir))
+    # Files are independent, so spread them over a process pool
+    with ProcessPoolExecutor() as executor:
+        for path, fixed in zip(paths, executor.map(fix_file, paths, chunksize=8)):
+            if fixed:
+                print('Fixed:', path)
 
 if __name__ == '__main__':
     main()